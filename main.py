@@ -6,6 +6,12 @@ import sys
 from src.ui import App
 from src.ratelimit import RateLimitManager
 
+# Prefer the libyaml-backed C loader/dumper, fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
 CONFIG_PATH = "config.yaml"
 
 DEFAULT_CONFIG = {
@@ -39,11 +45,11 @@ def load_config():
     if not os.path.exists(CONFIG_PATH):
         print(f"[{CONFIG_PATH}] not found. Creating default configuration...")
         with open(CONFIG_PATH, 'w') as f:
-            yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False)
+            yaml.dump(DEFAULT_CONFIG, f, Dumper=_YDumper, default_flow_style=False)
         return DEFAULT_CONFIG
         
     with open(CONFIG_PATH, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YLoader)
 
 def load_keys(keys_path):
     if not os.path.exists(keys_path):
@@ -56,8 +62,13 @@ def load_keys(keys_path):
 
 def save_keys(keys_path, keys):
     os.makedirs(os.path.dirname(keys_path), exist_ok=True)
-    with open(keys_path, 'w') as f:
-        json.dump(keys, f, indent=2)
+    # Write to a temp file and swap it in so a crash can't truncate the keys
+    tmp_path = keys_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(json.dumps(keys, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, keys_path)
 
 def prompt_for_keys(config, current_keys):
     """Scans config for required keys and prompts if missing."""
@@ -89,7 +100,7 @@ if __name__ == "__main__":
     keys_path = os.path.join(data_path, "keys.json")
     
     # 2. Configure Global Paths
-    RateLimitManager.set_data_path(data_path)
+    RateLimitManager.set_data_path(data_path) # Loads persisted cooldowns
     
     # 3. Load & Check Keys
     keys = load_keys(keys_path)
@@ -6,22 +6,29 @@ import sys
 
 APPIMAGE_SCRIPT = "packaging/build/appimage.sh"
 WINDOWS_SCRIPT = "packaging/build/windows.sh"
+VERSION_RE = re.compile(r'VERSION="v(\d+)\.(\d+)"')
 
-def get_current_version(file_path):
+def read_file(file_path):
     with open(file_path, "r") as f:
-        content = f.read()
-    match = re.search(r'VERSION="v(\d+)\.(\d+)"', content)
+        return f.read()
+
+def get_current_version(content):
+    match = VERSION_RE.search(content)
     if match:
         return int(match.group(1)), int(match.group(2))
     return None
 
-def update_version_in_file(file_path, major, minor):
+def update_version_in_file(file_path, major, minor, content=None):
+    """Bumps the version string; pass `content` when the file was already read."""
     new_version = f"v{major}.{minor}"
-    with open(file_path, "r") as f:
-        content = f.read()
-    
-    new_content = re.sub(r'VERSION="v\d+\.\d+"', f'VERSION="{new_version}"', content)
+    if content is None:
+        content = read_file(file_path)
     
+    new_content, count = VERSION_RE.subn(f'VERSION="{new_version}"', content)
+    if count == 0:
+        print(f"⚠️  No version string found in {file_path}, leaving it untouched.")
+        return new_version
+
     with open(file_path, "w") as f:
         f.write(new_content)
     return new_version
@@ -36,9 +43,47 @@ def run_command(cmd, shell=False, env=None):
         print(f"❌ Error running command: {e}")
         sys.exit(1)
 
+def run_parallel(scripts, env=None, log_dir="build"):
+    """Runs independent build scripts concurrently, one log file per script."""
+    if env is None:
+        env = os.environ.copy()
+    os.makedirs(log_dir, exist_ok=True)
+
+    procs = []
+    try:
+        for script in scripts:
+            log_path = os.path.join(log_dir, os.path.splitext(os.path.basename(script))[0] + ".log")
+            print(f"🚀 Running: {script} (log: {log_path})")
+            log = open(log_path, "w")
+            try:
+                proc = subprocess.Popen([script], stdout=log, stderr=subprocess.STDOUT, env=env)
+            except BaseException:
+                log.close()
+                raise
+            procs.append((script, log_path, log, proc))
+    except BaseException:
+        # A later build failed to start: don't leave the earlier ones running
+        for _, _, log, proc in procs:
+            proc.terminate()
+            proc.wait()
+            log.close()
+        raise
+
+    failed = False
+    for script, log_path, log, proc in procs:
+        rc = proc.wait()
+        log.close()
+        if rc != 0:
+            print(f"❌ Error running {script} (exit code {rc}), see {log_path}")
+            failed = True
+    if failed:
+        sys.exit(1)
+
 def main():
     # 1. Determine current version and increment
-    current = get_current_version(APPIMAGE_SCRIPT)
+    # Read once: the same content is used to find and to bump the version
+    appimage_content = read_file(APPIMAGE_SCRIPT)
+    current = get_current_version(appimage_content)
     if not current:
         print("❌ Could not find version in scripts.")
         sys.exit(1)
@@ -52,7 +97,7 @@ def main():
     
     # 2. Update files
     print("📝 Updating version in build scripts...")
-    update_version_in_file(APPIMAGE_SCRIPT, major, new_minor)
+    update_version_in_file(APPIMAGE_SCRIPT, major, new_minor, content=appimage_content)
     update_version_in_file(WINDOWS_SCRIPT, major, new_minor)
     
     # 3. Git commit and tag (Optional but recommended for releases)
@@ -67,12 +112,9 @@ def main():
     venv_bin = os.path.abspath("venv/bin")
     env["PATH"] = f"{venv_bin}{os.pathsep}{env.get('PATH', '')}"
 
-    # 4. Run Build Scripts
-    print("🔨 Running AppImage Build...")
-    run_command(["./packaging/build/appimage.sh"], env=env)
-    
-    print("🔨 Running Windows Build...")
-    run_command(["./packaging/build/windows.sh"], env=env)
+    # 4. Run Build Scripts (independent, so build both at once)
+    print("🔨 Running AppImage and Windows Builds...")
+    run_parallel(["./packaging/build/appimage.sh", "./packaging/build/windows.sh"], env=env)
     
     # 5. Create GitHub Release
     print(f"📦 Creating GitHub Release {new_version_str}...")
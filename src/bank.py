@@ -1,9 +1,18 @@
+import atexit
 import csv
 import os
+import queue
+import threading
 from dataclasses import dataclass, asdict
 from typing import List, Optional
 
-@dataclass
+# Accepted spellings of "true" in imported files and commands
+TRUE_TOKENS = frozenset(('true', '1', 'yes', 't'))
+
+# Writer queue token requesting a full rewrite of the bank file
+_FULL_SAVE = object()
+
+@dataclass(slots=True)
 class StatementEntry:
     id: int
     text: str
@@ -12,9 +21,34 @@ class StatementEntry:
 class StatementBank:
     def __init__(self, persistence_path: str = "data/bank.csv"):
         self.persistence_path = persistence_path
-        self.statements: List[StatementEntry] = []
+        # Keyed by id; dict insertion order keeps the bank order
+        self.statements: dict[int, StatementEntry] = {}
         self._next_id = 1
+        # Entries by normalized text, for O(1) duplicate detection and exact lookups
+        self._by_norm: dict[str, StatementEntry] = {}
+        # Statements partitioned by truth value, kept in bank order
+        self._true_stmts: dict[int, StatementEntry] = {}
+        self._false_stmts: dict[int, StatementEntry] = {}
+        # Lowercased text by id, so searches don't re-lower every row
+        self._lower_text: dict[int, str] = {}
+        # Skip repeated makedirs/exists syscalls once the file is known good
+        self._dir_ensured = False
+        self._has_header = False
+        # Bumped on every change so readers can cache data derived from the bank
+        self.version = 0
+        # (version, true texts, false texts) handed to the fuzzy check
+        self._known_texts = (-1, [], [])
         self.load()
+        # Highest id known to be on disk; queued appends at or below it are stale
+        self._saved_upto = self._next_id - 1
+
+        # Disk writes run on a single background writer so callers never block
+        self._save_q: queue.Queue = queue.Queue()
+        # Last failed write, re-raised to the caller by flush()
+        self._write_error: Optional[Exception] = None
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
 
     def load(self):
         if not os.path.exists(self.persistence_path):
@@ -25,6 +59,7 @@ class StatementBank:
                 reader = csv.reader(f)
                 header = next(reader, None) # Skip header
                 if not header: return
+                self._has_header = True
 
                 max_id = 0
                 for row in reader:
@@ -32,9 +67,16 @@ class StatementBank:
                     try:
                         entry_id = int(row[0])
                         text = row[1]
-                        is_true = row[2].lower() == 'true'
+                        # We write str(bool); only lowercase hand-edited values
+                        is_true = row[2] == 'True' or row[2].lower() == 'true'
                         
-                        self.statements.append(StatementEntry(entry_id, text, is_true))
+                        if entry_id in self.statements: continue
+
+                        entry = StatementEntry(entry_id, text, is_true)
+                        self.statements[entry_id] = entry
+                        self._partition(entry)[entry.id] = entry
+                        self._lower_text[entry_id] = text.lower()
+                        self._by_norm.setdefault(text.strip().lower(), entry)
                         if entry_id > max_id:
                             max_id = entry_id
                     except ValueError:
@@ -45,46 +87,162 @@ class StatementBank:
             print(f"Error loading bank: {e}")
 
     def save(self):
-        # Ensure dir exists
-        os.makedirs(os.path.dirname(self.persistence_path), exist_ok=True)
-        self.export_to_file(self.persistence_path, include_id=True)
+        """Schedules a full rewrite of the bank file."""
+        self._save_q.put(_FULL_SAVE)
+
+    def _append(self, entries: List[StatementEntry]):
+        """Schedules appending new rows instead of rewriting the file."""
+        self._save_q.put(entries)
+
+    def flush(self):
+        """Blocks until every scheduled write has reached the disk.
+        Raises the error of a write that failed since the last flush."""
+        self._save_q.join()
+        error, self._write_error = self._write_error, None
+        if error:
+            raise error
+
+    def close(self):
+        """Flushes pending writes and stops the writer thread."""
+        if self._writer.is_alive():
+            self._save_q.put(None)
+            self._writer.join()
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._save_q.get()]
+            # Coalesce everything queued meanwhile into a single write
+            while True:
+                try:
+                    batch.append(self._save_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch([t for t in batch if t is not None])
+            except Exception as e:
+                self._write_error = e
+                # Rows of a failed append never reached the disk; rewrite it all next time
+                self._has_header = False
+            finally:
+                for _ in batch:
+                    self._save_q.task_done()
+
+            if any(t is None for t in batch):
+                return
+
+    def _write_batch(self, batch: list):
+        if not batch:
+            return
+
+        if not self._has_header or any(t is _FULL_SAVE for t in batch):
+            # Ensure dir exists
+            if not self._dir_ensured:
+                dirname = os.path.dirname(self.persistence_path)
+                if dirname:
+                    os.makedirs(dirname, exist_ok=True)
+                self._dir_ensured = True
+
+            snapshot = list(self.statements.values())
+            self._write_rows(self.persistence_path, snapshot, include_id=True)
+            self._has_header = True
+            self._saved_upto = max([self._saved_upto] + [e.id for e in snapshot])
+            return
+
+        # Skip entries a previous full rewrite already covered
+        new_entries = [e for t in batch for e in t if e.id > self._saved_upto]
+        if not new_entries:
+            return
+        # A hand-edited file may lack a final line break; without one the
+        # first appended row would be glued onto the last existing row
+        needs_break = not self._ends_with_newline(self.persistence_path)
+        with open(self.persistence_path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if needs_break:
+                f.write(writer.dialect.lineterminator)
+            writer.writerows((e.id, e.text, e.is_true) for e in new_entries)
+        self._saved_upto = max(e.id for e in new_entries)
+
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        with open(path, 'rb') as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) in (b'\n', b'\r')
 
     def add(self, text: str, is_true: bool) -> bool:
         """Adds a statement. Returns True if added, False if duplicate."""
-        norm = text.strip().lower()
-        if any(s.text.strip().lower() == norm for s in self.statements):
+        entry = self._add_unsaved(text, is_true)
+        if not entry:
             return False
+        self._append([entry])
+        return True
+
+    def _add_unsaved(self, text: str, is_true: bool) -> Optional[StatementEntry]:
+        """Adds a statement without persisting. Returns None if duplicate."""
+        stripped = text.strip()
+        norm = stripped.lower()
+        if norm in self._by_norm:
+            return None
 
-        entry = StatementEntry(id=self._next_id, text=text.strip(), is_true=is_true)
-        self.statements.append(entry)
+        entry = StatementEntry(id=self._next_id, text=stripped, is_true=is_true)
+        self.statements[entry.id] = entry
+        self._partition(entry)[entry.id] = entry
+        self._lower_text[entry.id] = norm
+        self._by_norm[norm] = entry
         self._next_id += 1
+        self.version += 1
+        return entry
+
+    def remove(self, entry_id: int) -> bool:
+        entry = self.statements.pop(entry_id, None)
+        if not entry:
+            return False
+
+        del self._partition(entry)[entry_id]
+        self._lower_text.pop(entry_id, None)
+        norm = entry.text.strip().lower()
+        if self._by_norm.get(norm) is entry:
+            # A hand-edited file may hold the same text twice; keep the survivor findable
+            survivor = next((e for e in self.statements.values() if e.text.strip().lower() == norm), None)
+            if survivor:
+                self._by_norm[norm] = survivor
+            else:
+                del self._by_norm[norm]
+        self.version += 1
         self.save()
         return True
 
-    def remove(self, entry_id: int) -> bool:
-        initial_len = len(self.statements)
-        self.statements = [s for s in self.statements if s.id != entry_id]
-        if len(self.statements) < initial_len:
-            self.save()
-            return True
-        return False
+    def find_exact(self, text: str) -> Optional[StatementEntry]:
+        """The statement matching `text` ignoring case and surrounding whitespace."""
+        return self._by_norm.get(text.strip().lower())
+
+    def lower_text(self, entry: StatementEntry) -> str:
+        """Cached lowercase text of a statement, for case-insensitive search."""
+        # Readers on other threads may hold an entry that was just removed
+        return self._lower_text.get(entry.id) or entry.text.lower()
+
+    def _partition(self, entry: StatementEntry) -> dict[int, StatementEntry]:
+        return self._true_stmts if entry.is_true else self._false_stmts
 
     def get_filtered(self, filter_type: str = "all", search_query: str = "") -> List[StatementEntry]:
         if filter_type == "true":
-            base = [s for s in self.statements if s.is_true]
+            base = self._true_stmts
         elif filter_type == "false":
-            base = [s for s in self.statements if not s.is_true]
+            base = self._false_stmts
         else:
             base = self.statements
         
         if search_query:
             q = search_query.lower()
-            return [s for s in base if q in s.text.lower()]
+            lower_text = self._lower_text
+            return [s for s in base.values() if q in lower_text[s.id]]
             
-        return base
+        return list(base.values())
 
     def import_from_file(self, path: str, default_truth: Optional[bool] = None) -> tuple[int, int]:
-        added_count = 0
+        added: List[StatementEntry] = []
         dup_count = 0
         
         if not os.path.exists(path):
@@ -92,58 +250,65 @@ class StatementBank:
 
         _, ext = os.path.splitext(path)
         
-        with open(path, 'r', encoding='utf-8') as f:
+        # Parse everything up front, then run one tight insert loop
+        with open(path, 'r', encoding='utf-8', buffering=1 << 20) as f:
             if ext.lower() == '.csv':
-                reader = csv.reader(f)
-                for row in reader:
-                    if not row: continue
-                    text = row[0].strip()
-                    if not text: continue
-                    
-                    is_true = False
-                    if default_truth is not None:
-                         is_true = default_truth
-                    elif len(row) > 1:
-                         is_true = row[1].lower().strip() in ('true', '1', 'yes', 't')
-                    
-                    if self.add(text, is_true):
-                        added_count += 1
-                    else:
-                        dup_count += 1
+                rows = [row for row in csv.reader(f) if row]
+                if default_truth is not None:
+                    pairs = [(row[0], default_truth) for row in rows]
+                else:
+                    pairs = [(row[0], len(row) > 1 and row[1].lower().strip() in TRUE_TOKENS) for row in rows]
             else:
                 # Text file
-                for line in f:
-                    text = line.strip()
-                    if not text: continue
-                    is_true = default_truth if default_truth is not None else False
-                    
-                    if self.add(text, is_true):
-                        added_count += 1
-                    else:
-                        dup_count += 1
-                        
-        self.save()
-        return (added_count, dup_count)
+                is_true = default_truth if default_truth is not None else False
+                pairs = [(line, is_true) for line in f]
+
+        add = self._add_unsaved
+        for text, is_true in pairs:
+            text = text.strip()
+            if not text: continue
+
+            entry = add(text, is_true)
+            if entry:
+                added.append(entry)
+            else:
+                dup_count += 1
+
+        if added:
+            self._append(added)
+        return (len(added), dup_count)
 
 
 
     def export_to_file(self, path: str, filter_type: str = "all", include_id: bool = False) -> int:
         data = self.get_filtered(filter_type)
-        with open(path, 'w', newline='', encoding='utf-8') as f:
+        self._write_rows(path, data, include_id)
+        return len(data)
+
+    def _write_rows(self, path: str, data: List[StatementEntry], include_id: bool):
+        with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
             if include_id:
                 writer.writerow(['id', 'statement', 'is_true'])
-                for entry in data:
-                    writer.writerow([entry.id, entry.text, entry.is_true])
+                writer.writerows((e.id, e.text, e.is_true) for e in data)
             else:
                 writer.writerow(['statement', 'is_true'])
-                for entry in data:
-                    writer.writerow([entry.text, entry.is_true])
-        return len(data)
+                writer.writerows((e.text, e.is_true) for e in data)
     
     # Helpers for Logic integration
+    # Both lists are shared until the bank changes; callers must not mutate them
     def get_known_true_texts(self) -> List[str]:
-        return [s.text for s in self.statements if s.is_true]
+        return self._get_known_texts()[1]
 
     def get_known_false_texts(self) -> List[str]:
-        return [s.text for s in self.statements if not s.is_true]
+        return self._get_known_texts()[2]
+
+    def _get_known_texts(self) -> tuple:
+        known = self._known_texts
+        if known[0] != self.version:
+            known = self._known_texts = (
+                self.version,
+                [s.text for s in self._true_stmts.values()],
+                [s.text for s in self._false_stmts.values()],
+            )
+        return known
@@ -1,22 +1,98 @@
-from abc import ABC, abstractmethod
 from typing import List, Any
+from bisect import bisect_left
+import asyncio
 from prompt_toolkit.completion import Completion
+import re
 import shlex
-import asyncio
+import sys
+from src.bank import TRUE_TOKENS
+
+# One regex pass instead of shlex's per-character state machine.
+# Alternatives: "double" (backslash escapes), 'single', bare word, stray char.
+# Whitespace is shlex's own set, see _WS_RE.
+_TOKEN_RE = re.compile(r'"((?:[^"\\]|\\.)*)"|\'([^\']*)\'|((?:[^ \t\r\n"\'\\]|\\.)+)|([^ \t\r\n])', re.S)
+# shlex splits on exactly these; other Unicode spaces (e.g. NBSP) stay in words
+_WS_RE = re.compile(r'[ \t\r\n]+')
+_DQ_ESCAPE_RE = re.compile(r'\\(["\\])')
+_ESCAPE_RE = re.compile(r'\\(.)', re.S)
+
+# Single-character aliases: ? and / search, . verifies
+_ALIAS_CHARS = frozenset("?/.")
+# Commands whose unquoted arguments are taken as one whole sentence
+_SMART_CMDS = frozenset({":sv", ":ew", ":vs"})
+# Subcommands of the above that must not be swallowed as a sentence
+_SUBCMD_RE = re.compile(r'(?::sv|:ew|:vs)\s+(?:remove|retry)\b')
+
+def _tokenize(text: str, posix: bool = True) -> List[str]:
+    """
+    Splits a command line like shlex.split: quotes group words and are
+    removed, adjacent pieces join into one token.
+    Raises ValueError on an unclosed quote, like shlex.
+    """
+    # Common case (:bn, :b sb, :sb remove 3): nothing to unquote or unescape
+    if '"' not in text and "'" not in text and not (posix and '\\' in text):
+        return [p for p in _WS_RE.split(text) if p]
+
+    if not posix:
+        # Windows: shlex's non-POSIX rules (literal backslashes, quotes inside
+        # words kept) are subtle, so use it and strip matching outer quotes
+        parts = []
+        for p in shlex.split(text, posix=False):
+            if len(p) >= 2 and p[0] == p[-1] and p[0] in '"\'':
+                p = p[1:-1]
+            parts.append(p)
+        return parts
+
+    parts = []
+    last_end = -1
+    for m in _TOKEN_RE.finditer(text):
+        dq, sq, word, stray = m.groups()
+        if stray is not None:
+            raise ValueError("No closing quotation")
+
+        # Only run the unescape substitution on pieces that contain a backslash
+        if dq is not None:
+            piece = _DQ_ESCAPE_RE.sub(r'\1', dq) if '\\' in dq else dq
+        elif sq is not None:
+            piece = sq
+        else:
+            piece = _ESCAPE_RE.sub(r'\1', word) if '\\' in word else word
 
-class Command(ABC):
+        if m.start() == last_end:
+            parts[-1] += piece
+        else:
+            parts.append(piece)
+        last_end = m.end()
+    return parts
+
+def _iter_prefix(words: tuple, prefix: str):
+    """Yields the entries of the sorted tuple `words` that start with `prefix`."""
+    i = bisect_left(words, prefix)
+    while i < len(words) and words[i].startswith(prefix):
+        yield words[i]
+        i += 1
+
+def _apply_search(context: Any, query: str):
+    """Sets the statement bank view's filter, shared by :sb search, ? and /."""
+    sb_view = context.view_manager.views_by_name.get("sb")
+    if sb_view:
+        sb_view.search_query = query
+        sb_view.scroll_offset = 0
+        status = f"Filter set: {query}" if query else "Filter cleared"
+        context.show_message("Info", status)
+
+class Command:
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
 
-    @abstractmethod
     async def execute(self, context: Any, args: List[str]):
         """
-        Executes the command.
+        Executes the command. Subclasses must override this.
         :param context: The App instance.
         :param args: List of arguments passed to the command.
         """
-        pass
+        raise NotImplementedError
 
     def get_completions(self, completer: Any, text: str, args: List[str]):
         """Yields completions for arguments."""
@@ -54,99 +130,105 @@ class SwitchTabCommand(Command):
 class VerifierCommand(Command):
     def __init__(self):
         super().__init__(":sv", "Verify statements. Usage: `:sv \"statment\"` (supports multiple) | `:sv remove <id>` | `:sv clear` | `:sv retry <id>`")
+        self._subcmds = ("clear", "remove", "retry") # Sorted for bisect
+        self._handlers = {
+            "remove": self._do_remove,
+            "retry": self._do_retry,
+            "clear": self._do_clear,
+        }
 
     def get_completions(self, completer: Any, text: str, args: List[str]):
         arg_index = len(args) - 1
         
         if arg_index == 0:
-            subcmds = ["remove", "retry", "clear"]
-            for s in subcmds:
-                if s.startswith(text):
-                    yield Completion(s, start_position=-len(text))
+            for s in _iter_prefix(self._subcmds, text):
+                yield Completion(s, start_position=-len(text))
             
             # Also yield bank completions for statement verification
             yield from completer.get_bank_completions(text)
 
     async def execute(self, context: Any, args: List[str]):
         # Check for subcommands
-        # Check for subcommands
-        if args and args[0] == "remove":
-            # Usage: :sv remove <id>
-            if len(args) < 2:
-                context.show_message("Error", "Usage: :sv remove <id>")
-                return
-            try:
-                sid = int(args[1])
-                await context.state.remove_item(sid)
-                context.show_message("Success", f"Item {sid} removed.")
-            except ValueError:
-                context.show_message("Error", "Invalid ID.")
-            return
-
-        elif args and args[0] == "clear":
-            await context.state.clear()
-            context.show_message("Success", "Verification queue cleared.")
-            return
-
-        elif args and args[0] == "retry":
-            # Usage: :sv retry <id>
-            if len(args) < 2:
-                context.show_message("Error", "Usage: :sv retry <id>")
-                return
-            try:
-                sid = int(args[1])
-                # context is App instance
-                await context.process_retry_item(sid)
-            except ValueError:
-                context.show_message("Error", "Invalid ID.")
+        handler = self._handlers.get(args[0]) if args else None
+        if handler:
+            await handler(context, args)
             return
 
         # Normal verification flow
         context.view_manager.switch_to("sv")
         
-        for stmt in args:
-            if stmt:
-                # We assume context (App) has a method to process items
-                # We'll need to expose `process_new_item` in App
-                await context.process_new_item(stmt)
+        # We assume context (App) has a method to process items.
+        # The state lock is FIFO, so items are still queued in argument order.
+        coros = [context.process_new_item(stmt) for stmt in args if stmt]
+        if coros:
+            await asyncio.gather(*coros)
         
         # Autoscroll to bottom
-        vs_view = None
-        for v in context.view_manager.views:
-            if v.name == "sv":
-                vs_view = v
-                break
+        vs_view = context.view_manager.views_by_name.get("sv")
         if vs_view:
             vs_view.scroll(99999)
 
+    async def _do_remove(self, context: Any, args: List[str]):
+        # Usage: :sv remove <id>
+        if len(args) < 2:
+            context.show_message("Error", "Usage: :sv remove <id>")
+            return
+        try:
+            sid = int(args[1])
+            await context.state.remove_item(sid)
+            context.show_message("Success", f"Item {sid} removed.")
+        except ValueError:
+            context.show_message("Error", "Invalid ID.")
+
+    async def _do_clear(self, context: Any, args: List[str]):
+        await context.state.clear()
+        context.show_message("Success", "Verification queue cleared.")
+
+    async def _do_retry(self, context: Any, args: List[str]):
+        # Usage: :sv retry <id>
+        if len(args) < 2:
+            context.show_message("Error", "Usage: :sv retry <id>")
+            return
+        try:
+            sid = int(args[1])
+            # context is App instance
+            await context.process_retry_item(sid)
+        except ValueError:
+            context.show_message("Error", "Invalid ID.")
+
 class StatementBankCommand(Command):
     def __init__(self):
         super().__init__(":sb", "Statement Bank. Usage: :sb [add|remove|import|export|all|true|false]")
+        self._subcmds = ("add", "all", "export", "false", "import", "remove", "search", "true") # Sorted for bisect
+        self._handlers = {
+            "add": self._do_add,
+            "remove": self._do_remove,
+            "import": self._do_import,
+            "export": self._do_export,
+            "search": self._do_search,
+        }
 
     def get_completions(self, completer: Any, text: str, args: List[str]):
         arg_index = len(args) - 1
         
         if arg_index == 0:
-            subcmds = ["add", "remove", "import", "export", "true", "false", "all", "search"]
-            for s in subcmds:
-                if s.startswith(text):
-                    yield Completion(s, start_position=-len(text))
+            for s in _iter_prefix(self._subcmds, text):
+                yield Completion(s, start_position=-len(text))
             return
             
         subcmd = args[0]
         
         if arg_index == 1:
-            if subcmd in ["import", "export"]:
+            if subcmd in ("import", "export"):
                 yield from completer.get_path_completions(text)
                 
         if arg_index == 2:
-            options = []
-            if subcmd in ["add", "import"]: options = ["true", "false"]
-            elif subcmd == "export": options = ["all", "true", "false"]
+            options = ()
+            if subcmd in ("add", "import"): options = ("false", "true")
+            elif subcmd == "export": options = ("all", "false", "true")
             
-            for o in options:
-                if o.startswith(text):
-                    yield Completion(o, start_position=-len(text))
+            for o in _iter_prefix(options, text):
+                yield Completion(o, start_position=-len(text))
 
     async def execute(self, context: Any, args: List[str]):
         # Switch to tab first
@@ -156,74 +238,69 @@ class StatementBankCommand(Command):
             return
 
         subcmd = args[0].lower()
-        
-
+        handler = self._handlers.get(subcmd)
+        if not handler:
+            return
 
         # Operations
         try:
-            if subcmd == "add":
-                # args: add "text" true
-                if len(args) < 3:
-                     raise ValueError("Usage: :sb add 'text' true/false")
-                text = args[1]
-                is_true = args[2].lower() in ('true', '1', 'yes', 't')
-                is_true = args[2].lower() in ('true', '1', 'yes', 't')
-                if context.bank.add(text, is_true):
-                    context.show_message("Success", f"Statement added.")
-                else:
-                    context.show_message("Info", f"Ignored duplicate statement.")
-            
-            elif subcmd == "remove":
-                if len(args) < 2: raise ValueError("Usage: :sb remove <id>")
-                sid = int(args[1])
-                if context.bank.remove(sid):
-                    context.show_message("Success", f"Statement {sid} removed.")
-                else:
-                    context.show_message("Error", f"ID {sid} not found.")
-
-            elif subcmd == "import":
-                if len(args) < 2: raise ValueError("Usage: :sb import <file> [default_truth]")
-                path = args[1]
-                default_truth = None
-                if len(args) > 2:
-                    default_truth = args[2].lower() in ('true', '1', 'yes', 't')
-                
-                if len(args) > 2:
-                    default_truth = args[2].lower() in ('true', '1', 'yes', 't')
-                
-                count, dups = context.bank.import_from_file(path, default_truth)
-                msg = f"Imported {count} items."
-                if dups > 0:
-                    msg += f" Ignored {dups} duplicates."
-                context.show_message("Success", msg)
-
-            elif subcmd == "search":
-                # :sb search "query" or :sb search query words
-                query = " ".join(args[1:]) if len(args) > 1 else ""
-                
-                # Find the view to update state
-                sb_view = None
-                for v in context.view_manager.views:
-                    if v.name == "sb":
-                        sb_view = v
-                        break
-                
-                if sb_view:
-                    sb_view.search_query = query
-                    sb_view.scroll_offset = 0 
-                    status = f"Filter set: {query}" if query else "Filter cleared"
-                    context.show_message("Info", status)
-
-            elif subcmd == "export":
-                if len(args) < 2: raise ValueError("Usage: :sb export <file> [filter]")
-                path = args[1]
-                filter_type = args[2] if len(args) > 2 else "all"
-                count = context.bank.export_to_file(path, filter_type)
-                context.show_message("Success", f"Exported {count} items.")
-                
+            await handler(context, args)
         except Exception as e:
             context.show_message("Error", str(e))
 
+    async def _do_add(self, context: Any, args: List[str]):
+        # args: add "text" true
+        try:
+            _, text, truth = args[:3]
+        except ValueError:
+            raise ValueError("Usage: :sb add 'text' true/false") from None
+        is_true = truth.lower() in TRUE_TOKENS
+        if context.bank.add(text, is_true):
+            # Wait for the write off the event loop so disk errors reach the user
+            await asyncio.to_thread(context.bank.flush)
+            context.show_message("Success", f"Statement added.")
+        else:
+            context.show_message("Info", f"Ignored duplicate statement.")
+
+    async def _do_remove(self, context: Any, args: List[str]):
+        try:
+            _, sid = args[:2]
+        except ValueError:
+            raise ValueError("Usage: :sb remove <id>") from None
+        sid = int(sid)
+        if context.bank.remove(sid):
+            await asyncio.to_thread(context.bank.flush)
+            context.show_message("Success", f"Statement {sid} removed.")
+        else:
+            context.show_message("Error", f"ID {sid} not found.")
+
+    async def _do_import(self, context: Any, args: List[str]):
+        try:
+            _, path, *rest = args
+        except ValueError:
+            raise ValueError("Usage: :sb import <file> [default_truth]") from None
+        default_truth = rest[0].lower() in TRUE_TOKENS if rest else None
+        
+        count, dups = context.bank.import_from_file(path, default_truth)
+        await asyncio.to_thread(context.bank.flush)
+        msg = f"Imported {count} items."
+        if dups > 0:
+            msg += f" Ignored {dups} duplicates."
+        context.show_message("Success", msg)
+
+    async def _do_search(self, context: Any, args: List[str]):
+        # :sb search "query" or :sb search query words
+        _apply_search(context, " ".join(args[1:]))
+
+    async def _do_export(self, context: Any, args: List[str]):
+        try:
+            _, path, *rest = args
+        except ValueError:
+            raise ValueError("Usage: :sb export <file> [filter]") from None
+        filter_type = rest[0] if rest else "all"
+        count = context.bank.export_to_file(path, filter_type)
+        context.show_message("Success", f"Exported {count} items.")
+
 class VerifyDotAliasCommand(Command):
     def __init__(self):
         super().__init__(".", "Verify statements. Alias for :sv.")
@@ -236,83 +313,62 @@ class VerifyDotAliasCommand(Command):
             context.show_message("Error", "No statements provided.")
             return
 
-        count = 0
-        for stmt in args:
-            if stmt.strip():
-                await context.process_new_item(stmt)
-                count += 1
+        coros = [context.process_new_item(stmt) for stmt in args if stmt.strip()]
+        if coros:
+            await asyncio.gather(*coros)
+        count = len(coros)
                 
         context.show_message("Info", f"Added {count} statement(s).")
             
         # Autoscroll
-        vs_view = None
-        for v in context.view_manager.views:
-            if v.name == "sv":
-                vs_view = v
-                break
+        vs_view = context.view_manager.views_by_name.get("sv")
         if vs_view:
              vs_view.scroll(99999)
 
 class SearchAliasCommand(Command):
-    def __init__(self):
-        super().__init__("?", "Search Statement Bank. Alias for :sb search.")
+    def __init__(self, name: str = "?", description: str = "Search Statement Bank. Alias for :sb search."):
+        super().__init__(name, description)
 
     async def execute(self, context: Any, args: List[str]):
         # Switch to sb view
         context.view_manager.switch_to("sb")
         
-        query = " ".join(args)
-        
-        # Find view
-        sb_view = None
-        for v in context.view_manager.views:
-            if v.name == "sb":
-                sb_view = v
-                break
-        
-        if sb_view:
-            sb_view.search_query = query
-            sb_view.scroll_offset = 0 
-            status = f"Filter set: {query}" if query else "Filter cleared"
-            context.show_message("Info", status)
+        _apply_search(context, " ".join(args))
 
-class ForwardSearchAliasCommand(Command):
+class ForwardSearchAliasCommand(SearchAliasCommand):
+    """Same behaviour as `?`, bound to `/`."""
     def __init__(self):
-        super().__init__("/", "Search Statement Bank. Alias for :sb search.")
-
-    async def execute(self, context: Any, args: List[str]):
-        # Switch to sb view
-        context.view_manager.switch_to("sb")
-        
-        query = " ".join(args)
-        
-        # Find view
-        sb_view = None
-        for v in context.view_manager.views:
-            if v.name == "sb":
-                sb_view = v
-                break
-        
-        if sb_view:
-            sb_view.search_query = query
-            sb_view.scroll_offset = 0 
-            status = f"Filter set: {query}" if query else "Filter cleared"
-            context.show_message("Info", status)
+        super().__init__("/")
 
 class CommandRegistry:
     def __init__(self):
         self.commands = {}
+        # Sorted command names, for prefix completion with bisect
+        self.names = ()
+        # Rendered help text, rebuilt after new registrations
+        self._help_cache = None
 
     def register(self, command: Command):
+        self._help_cache = None
+        # Interned keys let lookups of interned names match by identity
+        command.name = sys.intern(command.name)
         self.commands[command.name] = command
+        self.names = tuple(sorted(self.commands))
+
+    def iter_names(self, prefix: str):
+        """Yields the registered command names starting with `prefix`."""
+        return _iter_prefix(self.names, prefix)
 
     async def execute(self, text: str, context: Any):
-        text = text.strip()
         if not text: return
+        # Input from the prompt is usually already trimmed
+        if text[0].isspace() or text[-1].isspace():
+            text = text.strip()
+            if not text: return
         
         # Special handling for aliases ?, /, .
-        if text.startswith("?") or text.startswith("/") or text.startswith("."):
-            cmd_name = text[0]
+        cmd_name = text[0]
+        if cmd_name in _ALIAS_CHARS:
             rest = text[1:].strip()
             args = []
             if rest:
@@ -322,7 +378,7 @@ class CommandRegistry:
                         # On Windows, we still want posix=True for consistent quoting 
                         # UNLESS it's a file path, but . usually takes statements.
                         # For simplicity, stick to standard split for statements.
-                        args = shlex.split(rest)
+                        args = _tokenize(rest)
                     except ValueError:
                         args = [rest]
                 else:
@@ -334,48 +390,23 @@ class CommandRegistry:
 
         parts = []
         try:
-            # Platform-aware parsing
-            import sys
-            is_windows = sys.platform == 'win32'
-            use_posix = not is_windows
-            
-            parts = shlex.split(text, posix=use_posix)
-            
-            # Post-processing for Windows (non-posix mode keeps quotes)
-            if is_windows:
-                new_parts = []
-                for p in parts:
-                    # Strip outer quotes if they match
-                    if len(p) >= 2 and (
-                        (p.startswith('"') and p.endswith('"')) or 
-                        (p.startswith("'") and p.endswith("'"))
-                    ):
-                        new_parts.append(p[1:-1])
-                    else:
-                        new_parts.append(p)
-                parts = new_parts
-                
+            # Platform-aware parsing: Windows keeps backslashes (paths) literal
+            parts = _tokenize(text, posix=sys.platform != 'win32')
         except ValueError:
             # Fallback for unclosed quote or parsing error
             parts = text.split(" ", 1)
         
         if not parts: return
         
-        cmd_name = parts[0]
+        cmd_name = sys.intern(parts[0])
         args = parts[1:]
 
         # SMART PARSING LIMITATION:
         # For verification/writing commands, we prefer "whole sentence" interpretation 
         # if the user didn't explicitly quote.
-        smart_commands = [":sv", ":ew", ":vs"]
-        
         # Exception: if it looks like a subcommand (remove/retry) for :sv/:vs, don't smart parse
-        is_subcommand = False
-        if cmd_name in [":sv", ":vs", ":ew"]:
-             if text.startswith(f"{cmd_name} remove") or text.startswith(f"{cmd_name} retry"):
-                 is_subcommand = True
-
-        if cmd_name in smart_commands and ('"' not in text and "'" not in text) and not is_subcommand:
+        if (cmd_name in _SMART_CMDS and ('"' not in text and "'" not in text)
+                and not _SUBCMD_RE.match(text)):
              raw_parts = text.split(None, 1)
              if len(raw_parts) > 1:
                  args = [raw_parts[1]]
@@ -389,6 +420,9 @@ class CommandRegistry:
     
     def get_help_text(self) -> str:
         """Generates markdown help text from registered commands and system features."""
+        if self._help_cache is not None:
+            return self._help_cache
+
         lines = [
             "# Navigation",
             "- `Tab` / `Shift-Tab`: Switch between views (Tabs)",
@@ -417,4 +451,5 @@ class CommandRegistry:
                     cmd = self.commands[name]
                     lines.append(f"- `{cmd.name}`: {cmd.description}")
         
-        return "\n".join(lines)
+        self._help_cache = "\n".join(lines)
+        return self._help_cache
@@ -1,8 +1,106 @@
-from prompt_toolkit.completion import Completer, Completion, PathCompleter
+from prompt_toolkit.completion import Completer, Completion, PathCompleter, ThreadedCompleter
 from prompt_toolkit.document import Document
-import shlex
 import re
 import os
+from bisect import bisect_left, bisect_right
+import heapq
+from typing import List
+
+# Word following a bank match: with its leading spaces if the match ended on
+# a word boundary, otherwise the rest of the partially typed word
+_NEXT_WORD_RE = re.compile(r" \s*\S+|\S+")
+
+# Shorter queries match most of the bank and aren't worth suggesting for
+MIN_BANK_QUERY_LEN = 2
+# Most suggestions offered for one bank query (alphabetically first)
+MAX_BANK_SUGGESTIONS = 100
+# Bank queries remembered per bank version before the memo is reset
+BANK_MEMO_SIZE = 256
+# Scan the whole haystack once candidates exceed 1/SCAN_FRACTION of the bank
+SCAN_FRACTION = 8
+# Pooled Completion objects kept before the pool is reset
+COMPLETION_POOL_SIZE = 4096
+
+# Aliases whose whole argument is a statement: ? and / search, . verifies
+_BANK_ALIASES = frozenset("?/.")
+
+def _extract_query(text: str):
+    """Returns the bank query typed after an alias or `:sb search`, or None."""
+    if text and text[0] in _BANK_ALIASES:
+        # Skip prefix and the spaces after it
+        return text[1:].lstrip(' ')
+    if ":sb" in text:
+        # Anchored on the first two words, so "search" inside the query is ignored
+        head = text.split(None, 2)
+        if len(head) == 3 and head[0] == ":sb" and head[1].lower() == "search":
+            return head[2]
+    return None
+
+def _list_dir_names(path: str) -> set:
+    """Names of the subdirectories of `path` (symlinks followed), from one scandir."""
+    try:
+        with os.scandir(path or os.curdir) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+class _BankIndex:
+    """
+    Substring index over a snapshot of the statement bank.
+    Every suffix of every distinct lowercased word is kept sorted, so the
+    statements containing a word fragment are found with a bisect instead
+    of scanning the whole bank.
+    """
+    def __init__(self, bank):
+        self.version = bank.version
+        entries = list(bank.statements.values())
+        # Parallel lists (original and lowercased text) instead of entry objects
+        self.texts = [e.text for e in entries]
+        self.lowers = [bank.lower_text(e) for e in entries]
+
+        # word -> positions in self.texts
+        self.postings = {}
+        for i, low in enumerate(self.lowers):
+            for word in set(low.split()):
+                self.postings.setdefault(word, []).append(i)
+
+        self.suffixes = sorted(
+            (word[k:], word) for word in self.postings for k in range(len(word))
+        )
+
+        # All lowercased texts in one string, for scans the word index can't narrow.
+        # A query never contains the NUL separator, so matches can't span statements.
+        self.haystack = "\0".join(self.lowers)
+        self.starts = []
+        offset = 0
+        for low in self.lowers:
+            self.starts.append(offset)
+            offset += len(low) + 1
+
+    def candidates(self, fragment: str) -> set:
+        """Positions of statements with a word containing `fragment`."""
+        found = set()
+        suffixes = self.suffixes
+        i = bisect_left(suffixes, (fragment,))
+        while i < len(suffixes) and suffixes[i][0].startswith(fragment):
+            found.update(self.postings[suffixes[i][1]])
+            i += 1
+        return found
+
+    def scan(self, q_low: str) -> list:
+        """(row, offset) of the first match in each statement, from one haystack."""
+        hits = []
+        starts = self.starts
+        find = self.haystack.find
+        pos = find(q_low)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            hits.append((row, pos - starts[row]))
+            if row + 1 == len(starts):
+                break
+            # Only the first match per statement counts, skip to the next one
+            pos = find(q_low, starts[row + 1])
+        return hits
 
 class ConsoleCompleter(Completer):
     def __init__(self, registry, bank=None):
@@ -10,15 +108,30 @@ class ConsoleCompleter(Completer):
         self.bank = bank
         # expanduser=True allows ~/paths
         self.path_completer = PathCompleter(expanduser=True)
+        # (text, parts) of the previous completion request
+        self._last_split = ("", [''])
+        self._bank_index = None
+        # (index, lowercased query, matching rows) of the last bank search
+        self._last_matches = (None, "", [])
+        # (index, {query: completions}) for repeated bank queries, e.g. after backspace
+        self._bank_memo = (None, {})
+        # Reused Completion objects keyed by (text, start_position)
+        self._completion_pool = {}
 
     def get_path_completions(self, text):
         dummy_doc = Document(text, cursor_position=len(text))
+        dir_names = None
         for compl in self.path_completer.get_completions(dummy_doc, None):
             c_text = compl.text
             prefix = text[:len(text) + compl.start_position]
-            full_path = prefix + c_text
-            if os.path.isdir(os.path.expanduser(full_path)) and not c_text.endswith(os.sep):
-                c_text += os.sep
+            full_path = os.path.expanduser(prefix + c_text)
+            if not c_text.endswith(os.sep):
+                # Candidates share one parent: list its subdirectories once
+                # instead of a stat() per candidate
+                if dir_names is None:
+                    dir_names = _list_dir_names(os.path.dirname(full_path))
+                if os.path.basename(full_path) in dir_names:
+                    c_text += os.sep
             yield Completion(
                 c_text,
                 start_position=compl.start_position,
@@ -29,52 +142,104 @@ class ConsoleCompleter(Completer):
             )
 
     def get_bank_completions(self, query):
-        if not query: return
+        if len(query) < MIN_BANK_QUERY_LEN: return
+
+        index = self._get_bank_index()
+        memo_index, memo = self._bank_memo
+        if memo_index is not index:
+            # The bank changed: earlier results may be stale
+            memo = {}
+            self._bank_memo = (index, memo)
+
+        completions = memo.get(query)
+        if completions is None:
+            completions = self._search_bank(index, query)
+            if len(memo) >= BANK_MEMO_SIZE:
+                memo.clear()
+            memo[query] = completions
+        yield from completions
+
+    def _search_bank(self, index: _BankIndex, query: str) -> List[Completion]:
         q_low = query.lower()
         suggestions = set()
+
+        # Any match contains each word fragment of the query inside one of
+        # its words, so intersecting their candidates narrows the rows to check
+        fragments = sorted(set(q_low.split()), key=len, reverse=True)
+        if fragments:
+            rows = index.candidates(fragments[0])
+            for fragment in fragments[1:]:
+                # Short fragments match most of the bank and barely narrow it
+                if len(fragment) < 3 or not rows:
+                    break
+                rows &= index.candidates(fragment)
+        else:
+            rows = range(len(index.texts))
+
+        last_index, last_q, last_rows = self._last_matches
+        if last_index is index and q_low.startswith(last_q) and len(last_rows) < len(rows):
+            # Extending the query can only drop matches: rescan the last ones
+            rows = last_rows
         
-        for stmt in self.bank.statements:
-            s_text = stmt.text
-            idx = s_text.lower().find(q_low)
-            if idx != -1:
-                remainder = s_text[idx + len(query):]
-                if not remainder: continue 
-                
-                next_chunk = ""
-                if remainder[0] == ' ':
-                    m = re.match(r"^(\s+\S+)", remainder)
-                    if m: next_chunk = m.group(1)
-                else:
-                    m = re.match(r"^(\S+)", remainder)
-                    if m: next_chunk = m.group(1)
-                
-                if next_chunk:
-                    full_seg = s_text[idx : idx + len(query) + len(next_chunk)]
-                    suggestions.add(full_seg)
+        if len(rows) * SCAN_FRACTION > len(index.texts) and "\0" not in q_low:
+            # Too many candidates: one find() sweep over the haystack beats a call per row
+            hits = index.scan(q_low)
+        else:
+            lowers = index.lowers
+            hits = [(i, idx) for i in rows if (idx := lowers[i].find(q_low)) != -1]
+
+        # Locals for the hot loop
+        texts = index.texts
+        add_suggestion = suggestions.add
+        q_len = len(query)
+        next_word = _NEXT_WORD_RE.match
+        for i, idx in hits:
+            s_text = texts[i]
+            # Match in place after the query instead of slicing the remainder
+            m = next_word(s_text, idx + q_len)
+            if m:
+                add_suggestion(s_text[idx : m.end()])
+
+        self._last_matches = (index, q_low, [i for i, _ in hits])
         
-        for s in sorted(list(suggestions)):
-             yield Completion(s, start_position=-len(query))
+        # Partial heap sort: only the shown suggestions get ordered
+        make = self._completion
+        return [make(s, -q_len) for s in heapq.nsmallest(MAX_BANK_SUGGESTIONS, suggestions)]
+
+    def _completion(self, text: str, start_position: int) -> Completion:
+        """Returns a pooled Completion; building one formats its display text."""
+        key = (text, start_position)
+        completion = self._completion_pool.get(key)
+        if completion is None:
+            if len(self._completion_pool) >= COMPLETION_POOL_SIZE:
+                self._completion_pool.clear()
+            completion = self._completion_pool[key] = Completion(text, start_position=start_position)
+        return completion
+
+    def _get_bank_index(self) -> _BankIndex:
+        index = self._bank_index
+        if index is None or index.version != self.bank.version:
+            index = self._bank_index = _BankIndex(self.bank)
+        return index
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
         
-        # Alias ? (Search), / (Search), . (Verify)
-        if (text.startswith("?") or text.startswith("/") or text.startswith(".")) and self.bank:
-             # Skip prefix
-             start_idx = 1
-             while start_idx < len(text) and text[start_idx] == ' ':
-                 start_idx += 1
-             
-             query = text[start_idx:]
+        query = _extract_query(text)
+        if query is not None and self.bank:
              yield from self.get_bank_completions(query)
              return
 
-        # Robust splitting: Filter empty parts but keep trailing empty if space present
-        raw_parts = [p for p in text.split(' ') if p]
-        if text.endswith(' '):
-            parts = raw_parts + ['']
+        last_text, last_parts = self._last_split
+        if text.startswith(last_text) and ' ' not in text[len(last_text):]:
+            # Still typing the same word: only the last part grows
+            parts = last_parts[:-1] + [last_parts[-1] + text[len(last_text):]]
         else:
-            parts = raw_parts if raw_parts else ['']
+            # Current word is everything after the last space (empty after a
+            # trailing space); split() drops the empty runs between earlier words
+            head, _, current_word = text.rpartition(' ')
+            parts = head.split() + [current_word]
+        self._last_split = (text, parts)
             
         # Determine argument index being typed
         arg_index = len(parts) - 1
@@ -83,9 +248,8 @@ class ConsoleCompleter(Completer):
         # 1. Top Level Command
         if arg_index == 0:
              if not current_word or current_word.startswith(":"):
-                 for name in self.registry.commands:
-                     if name.startswith(current_word):
-                         yield Completion(name, start_position=-len(current_word))
+                 for name in self.registry.iter_names(current_word):
+                     yield self._completion(name, -len(current_word))
              return
 
         cmd_name = parts[0]
@@ -94,4 +258,5 @@ class ConsoleCompleter(Completer):
              yield from cmd_obj.get_completions(self, current_word, parts[1:])
 
 def create_completer(registry, bank=None):
-    return ConsoleCompleter(registry, bank)
+    # Bank searches run on a worker thread so typing never waits on them
+    return ThreadedCompleter(ConsoleCompleter(registry, bank))
@@ -0,0 +1,35 @@
+import asyncio
+
+# Seconds a burst of changes is coalesced for before the history is rewritten
+SAVE_DELAY = 0.25
+
+class DebouncedSave:
+    """Runs `save` once after a burst of schedule() calls instead of on each one."""
+
+    def __init__(self, save, delay: float = SAVE_DELAY):
+        self._save = save
+        self._delay = delay
+        self._handle = None
+
+    def schedule(self):
+        if self._handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to defer to
+            self._save()
+            return
+        self._handle = loop.call_later(self._delay, self.now)
+
+    def now(self):
+        """Saves immediately; this covers any save still pending."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._save()
+
+    def flush(self):
+        """Writes a pending debounced save now."""
+        if self._handle is not None:
+            self.now()
@@ -1,10 +1,15 @@
 from typing import Any, List
 from prompt_toolkit.completion import Completion
 import asyncio
-from src.commands import Command
+from src.commands import Command, _iter_prefix
 from src.essay_data import MaterialBank, EssayBank, EssaySession, EssayItem
 from src.essay_logic import EssayGenerator
 
+# Subcommand names, sorted for prefix lookup with bisect
+_MB_SUBCMDS = ("add", "remove")
+_EB_SUBCMDS = ("import", "remove")
+_EW_SUBCMDS = ("remove",)
+
 class MaterialBankCommand(Command):
     def __init__(self):
         super().__init__(":mb", "Manage Material Bank (PDFs/context). Usage: `:mb add <path>` | `:mb remove <id>`")
@@ -12,9 +17,8 @@ class MaterialBankCommand(Command):
     def get_completions(self, completer: Any, text: str, args: List[str]):
         arg_index = len(args) - 1
         if arg_index == 0:
-            for s in ["add", "remove"]:
-                if s.startswith(text):
-                    yield Completion(s, start_position=-len(text))
+            for s in _iter_prefix(_MB_SUBCMDS, text):
+                yield Completion(s, start_position=-len(text))
         elif arg_index == 1 and args[0] == "add":
             yield from completer.get_path_completions(text)
 
@@ -48,9 +52,8 @@ class EssayBankCommand(Command):
     def get_completions(self, completer: Any, text: str, args: List[str]):
         arg_index = len(args) - 1
         if arg_index == 0:
-            for s in ["import", "remove"]:
-                if s.startswith(text):
-                    yield Completion(s, start_position=-len(text))
+            for s in _iter_prefix(_EB_SUBCMDS, text):
+                yield Completion(s, start_position=-len(text))
         elif arg_index == 1 and args[0] == "import":
             yield from completer.get_path_completions(text)
 
@@ -85,8 +88,8 @@ class EssayWriterCommand(Command):
     def get_completions(self, completer: Any, text: str, args: List[str]):
         arg_index = len(args) - 1
         if arg_index == 0:
-            if "remove".startswith(text):
-                yield Completion("remove", start_position=-len(text))
+            for s in _iter_prefix(_EW_SUBCMDS, text):
+                yield Completion(s, start_position=-len(text))
 
     async def execute(self, context: Any, args: List[str]):
         if not args:
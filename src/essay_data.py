@@ -1,11 +1,11 @@
 import json
 import csv
 import os
-import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import List, Optional
+from src.debounce import DebouncedSave
 
-@dataclass
+@dataclass(slots=True)
 class MaterialItem:
     path: str
     id: int = 0
@@ -20,6 +20,8 @@ class MaterialBank:
     def __init__(self, persistence_file="data/materials.json"):
         self.items: List[MaterialItem] = []
         self.persistence_file = persistence_file
+        # Id for the next added item, so adds don't rescan the list
+        self._next_id = 1
         self._load()
     
     def _load(self):
@@ -30,13 +32,14 @@ class MaterialBank:
                 self.items = [MaterialItem(**d) for d in data]
         except Exception:
             self.items = []
+        self._next_id = max((i.id for i in self.items), default=0) + 1
 
     def _save(self):
         try:
             # Don't save file_handle, it's runtime only
             data = [{"path": i.path, "id": i.id} for i in self.items]
             with open(self.persistence_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(json.dumps(data, indent=2))
         except Exception as e:
             print(f"Error saving MaterialBank: {e}")
 
@@ -45,9 +48,8 @@ class MaterialBank:
         for i in self.items:
             if i.path == path: return i
             
-        new_id = 1
-        if self.items:
-             new_id = max(i.id for i in self.items) + 1
+        new_id = self._next_id
+        self._next_id += 1
         
         item = MaterialItem(path=path, id=new_id)
         self.items.append(item)
@@ -55,10 +57,13 @@ class MaterialBank:
         return item
 
     def remove_item(self, item_id: int):
-        self.items = [i for i in self.items if i.id != item_id]
-        self._save()
+        for idx, i in enumerate(self.items):
+            if i.id == item_id:
+                del self.items[idx]
+                self._save()
+                return
 
-@dataclass
+@dataclass(slots=True)
 class EssayExample:
     question: str
     answer: str
@@ -68,61 +73,88 @@ class EssayBank:
     def __init__(self, persistence_file="data/essay_examples.csv"):
         self.examples: List[EssayExample] = []
         self.persistence_file = persistence_file
+        # Normalized (question, answer) pairs for O(1) duplicate detection
+        self._norm_index: set[tuple[str, str]] = set()
+        # Id for the next added example, so adds don't rescan the list
+        self._next_id = 1
+        # Bumped on every change so callers can cache derived data
+        self.version = 0
+        # path -> (mtime_ns, delimiter) of files already sniffed by import_from_file
+        self._sniff_cache: dict[str, tuple[int, str]] = {}
         self._load()
 
     def _load(self):
         if not os.path.exists(self.persistence_file): return
         try:
-            with open(self.persistence_file, 'r', newline='', encoding='utf-8') as f:
+            with open(self.persistence_file, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 reader = csv.reader(f, delimiter=';')
                 self.examples = []
                 for i, row in enumerate(reader):
                     if len(row) >= 2:
                         self.examples.append(EssayExample(question=row[0], answer=row[1], id=i+1))
+                        self._norm_index.add(self._norm_key(row[0], row[1]))
         except Exception:
             self.examples = []
+            self._norm_index = set()
+        self._next_id = max((e.id for e in self.examples), default=0) + 1
 
     def _save(self):
         try:
-            with open(self.persistence_file, 'w', newline='', encoding='utf-8') as f:
+            # Write a temp file and swap it in so a crash can't truncate the bank
+            tmp_path = self.persistence_file + ".tmp"
+            with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f, delimiter=';')
-                for ex in self.examples:
-                    writer.writerow([ex.question, ex.answer])
+                writer.writerows((ex.question, ex.answer) for ex in self.examples)
+            os.replace(tmp_path, self.persistence_file)
         except Exception as e:
             print(f"Error saving EssayBank: {e}")
 
     def add_example(self, question: str, answer: str) -> bool:
         """Adds an example with duplicate detection. Returns True if added, False if duplicate."""
-        q_norm = question.strip().lower()
-        a_norm = answer.strip().lower()
-        
-        for ex in self.examples:
-            if ex.question.strip().lower() == q_norm and ex.answer.strip().lower() == a_norm:
-                return False
+        if not self._add_unsaved(question, answer):
+            return False
+        self._save()
+        return True
+
+    def _add_unsaved(self, question: str, answer: str) -> bool:
+        """Adds an example without persisting. Returns False if duplicate."""
+        key = self._norm_key(question, answer)
+        if key in self._norm_index:
+            return False
         
-        new_id = 1
-        if self.examples:
-            new_id = max(e.id for e in self.examples) + 1
+        new_id = self._next_id
+        self._next_id += 1
         
         self.examples.append(EssayExample(question=question.strip(), answer=answer.strip(), id=new_id))
-        self._save()
+        self._norm_index.add(key)
+        self.version += 1
         return True
 
+    @staticmethod
+    def _norm_key(question: str, answer: str) -> tuple[str, str]:
+        return (question.strip().lower(), answer.strip().lower())
+
     def import_from_file(self, path: str) -> tuple[int, int]:
         """Imports examples from a CSV, appending them. Returns (added_count, duplicate_count)."""
         added_count = 0
         dup_count = 0
         try:
-            with open(path, 'r', newline='', encoding='utf-8') as f:
-                # Sniff delimiter
-                try:
-                    sample = f.read(2048)
-                    f.seek(0)
-                    dialect = csv.Sniffer().sniff(sample)
-                    delimiter = dialect.delimiter
-                except csv.Error:
-                    f.seek(0)
-                    delimiter = ',' # Fallback
+            mtime = os.stat(path).st_mtime_ns
+            with open(path, 'r', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                cached = self._sniff_cache.get(path)
+                if cached and cached[0] == mtime:
+                    delimiter = cached[1]
+                else:
+                    # Sniff delimiter
+                    try:
+                        sample = f.read(2048)
+                        f.seek(0)
+                        dialect = csv.Sniffer().sniff(sample)
+                        delimiter = dialect.delimiter
+                    except csv.Error:
+                        f.seek(0)
+                        delimiter = ',' # Fallback
+                    self._sniff_cache[path] = (mtime, delimiter)
                 
                 reader = csv.reader(f, delimiter=delimiter)
                 for row in reader:
@@ -132,20 +164,32 @@ class EssayBank:
                            row[0].strip().lower() == "question" and row[1].strip().lower() == "answer":
                             continue
 
-                        if self.add_example(row[0], row[1]):
+                        if self._add_unsaved(row[0], row[1]):
                             added_count += 1
                         else:
                             dup_count += 1
+
+            # Rewrite the file once for the whole import
+            if added_count:
+                self._save()
             return (added_count, dup_count)
         except Exception as e:
             # print(f"Import error: {e}") # Debug
             return (0, 0)
             
     def remove_item(self, item_id: int):
-        self.examples = [e for e in self.examples if e.id != item_id]
-        self._save()
-
-@dataclass
+        for idx, e in enumerate(self.examples):
+            if e.id == item_id:
+                del self.examples[idx]
+                key = self._norm_key(e.question, e.answer)
+                # Loaded files may repeat an example; keep the key while a copy remains
+                if not any(self._norm_key(o.question, o.answer) == key for o in self.examples):
+                    self._norm_index.discard(key)
+                self.version += 1
+                self._save()
+                return
+
+@dataclass(slots=True)
 class EssayItem:
     question: str
     answer: Optional[str] = None
@@ -156,6 +200,10 @@ class EssaySession:
     def __init__(self, persistence_file="data/essay_history.json"):
         self.items: List[EssayItem] = []
         self.persistence_file = persistence_file
+        # Id for the next added question, so adds don't rescan the list
+        self._next_id = 1
+        # Coalesces status-change saves, see schedule_save()
+        self._saver = DebouncedSave(self._write)
         self._load()
         
     def _load(self):
@@ -166,22 +214,37 @@ class EssaySession:
                 self.items = [EssayItem(**d) for d in data]
         except Exception:
             self.items = []
+        self._next_id = max((i.id for i in self.items), default=0) + 1
 
     def save(self):
+        self._saver.now()
+
+    def _write(self):
         try:
-            data = [vars(i) for i in self.items]
+            data = [asdict(i) for i in self.items]
             with open(self.persistence_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                f.write(json.dumps(data, indent=2))
         except Exception:
             pass
 
+    def schedule_save(self):
+        """Saves once after a burst of status changes instead of on each one."""
+        self._saver.schedule()
+
+    def flush(self):
+        """Writes a pending debounced save now."""
+        self._saver.flush()
+
     def add_question(self, question: str) -> EssayItem:
-        new_id = 1
-        if self.items: new_id = max(i.id for i in self.items) + 1
+        new_id = self._next_id
+        self._next_id += 1
         item = EssayItem(question=question, id=new_id)
         self.items.append(item)
         self.save()
         return item
     def remove_item(self, item_id: int):
-        self.items = [i for i in self.items if i.id != item_id]
-        self.save()
+        for idx, i in enumerate(self.items):
+            if i.id == item_id:
+                del self.items[idx]
+                self.save()
+                return
@@ -3,41 +3,57 @@ from src.manager import ProviderManager
 from src.essay_data import MaterialBank, EssayBank, EssayItem, EssaySession
 import asyncio
 
+# Most material uploads in flight to one provider at a time
+UPLOAD_CONCURRENCY = 4
+
 class EssayGenerator:
     def __init__(self, manager: ProviderManager, m_bank: MaterialBank, e_bank: EssayBank, session: EssaySession):
         self.manager = manager
         self.m_bank = m_bank
         self.e_bank = e_bank
         self.session = session
+        # (examples version, prompt) of the last built system prompt
+        self._prompt_cache = (-1, "")
 
     async def _ensure_uploads_for_provider(self, provider: Any) -> List[Any]:
         """Uploads files to a specific provider if not already present."""
         p_name = f"{provider.provider_name}_{provider.model_name}"
-        handles = []
-        
-        for item in self.m_bank.items:
+        sem = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+        async def upload(item):
             handle = item.file_handles.get(p_name)
-            if not handle:
+            if handle:
+                return handle
+            async with sem:
                 try:
                     handle = await provider.upload_file(item.path)
                     item.file_handles[p_name] = handle
+                    return handle
                 except Exception:
                     # If one fails, we continue; the model might still work without some files
                     # or fail later during generation which is better than hard crash here.
-                    continue
-            if handle:
-                handles.append(handle)
-        return handles
+                    return None
+
+        # Uploads are independent, so run them side by side; results keep material order
+        handles = await asyncio.gather(*(upload(item) for item in self.m_bank.items))
+        return [h for h in handles if h]
 
     def _build_system_prompt(self) -> str:
-        prompt = "You are an expert essay writer. Answer the specific question below using the provided context files.\n\n"
+        version, prompt = self._prompt_cache
+        if version == self.e_bank.version:
+            return prompt
+
+        version = self.e_bank.version
+        parts = ["You are an expert essay writer. Answer the specific question below using the provided context files.\n\n"]
         
         if self.e_bank.examples:
-            prompt += "Style Examples (Mimic the tone, length, and structure of these):\n"
-            for ex in self.e_bank.examples:
-                prompt += f"Q: {ex.question}\nA: {ex.answer}\n---\n"
-            prompt += "\n"
+            parts.append("Style Examples (Mimic the tone, length, and structure of these):\n")
+            parts.extend(f"Q: {ex.question}\nA: {ex.answer}\n---\n" for ex in self.e_bank.examples)
+            parts.append("\n")
             
+        # One join instead of re-copying the growing prompt per example
+        prompt = "".join(parts)
+        self._prompt_cache = (version, prompt)
         return prompt
 
     async def run(self, item: EssayItem, on_update=None):
@@ -47,7 +63,7 @@ class EssayGenerator:
             item.status = msg
             # Only save to disk for 'major' status changes, not every tick of a countdown
             if not msg or not msg.startswith("Rate limited"):
-                self.session.save()
+                self.session.schedule_save()
             if on_update: on_update(msg)
 
         async def generate_task(provider: Any, on_update=None):
@@ -1,6 +1,7 @@
 from google import genai
 from dotenv import load_dotenv
 import os
+import sys
 
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
@@ -12,9 +13,14 @@ if not api_key:
 client = genai.Client(api_key=api_key)
 
 print("Listing available models...")
+# Names are collected and written once instead of a write per model
+names = []
 try:
     # New SDK wrapper for listing models
     for m in client.models.list(config={'page_size': 100}):
-        print(f"- {m.name}")
+        names.append(f"- {m.name}")
 except Exception as e:
-    print(f"Error: {e}")
+    names.append(f"Error: {e}")
+
+if names:
+    sys.stdout.write("\n".join(names) + "\n")
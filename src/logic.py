@@ -11,23 +11,83 @@ class StatementChecker:
         self.bank = bank
         self.true_file = os.path.join(data_dir, "true_statements.txt")
         self.false_file = os.path.join(data_dir, "false_statements.txt")
+        # path -> (mtime_ns, normalized lines) of the legacy statement files
+        self._file_sets = {}
+        # (method, normalized statement, snapshot) -> (future, progress listeners) of running provider calls
+        self._inflight: Dict[tuple, tuple] = {}
         # Initialize manager with keys
         self.manager = manager if manager else ProviderManager(api_keys=api_keys)
 
-    async def _check_file(self, file_path: str, statement: str) -> bool:
+    @staticmethod
+    def _read_set(file_path: str) -> frozenset:
         try:
             with open(file_path, 'r') as f:
-                return statement in [line.strip().lower() for line in f]
+                return frozenset(line.strip().lower() for line in f)
         except FileNotFoundError:
-            return False
+            return frozenset()
 
-    async def _read_lines(self, file_path: str) -> List[str]:
+    @staticmethod
+    def _read_lines_sync(file_path: str) -> List[str]:
         try:
             with open(file_path, 'r') as f:
                 return [line.strip() for line in f]
         except FileNotFoundError:
             return []
 
+    async def _known_set(self, file_path: str) -> frozenset:
+        """Normalized lines of a statement file, reparsed only when it changes."""
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+
+        cached = self._file_sets.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        # Only a reload pays for the thread hop; reads never block the loop
+        lines = await asyncio.to_thread(self._read_set, file_path)
+        self._file_sets[file_path] = (mtime, lines)
+        return lines
+
+    async def _check_file(self, file_path: str, statement: str) -> bool:
+        return statement in await self._known_set(file_path)
+
+    async def _read_lines(self, file_path: str) -> List[str]:
+        return await asyncio.to_thread(self._read_lines_sync, file_path)
+
+    async def _shared_call(self, method_name: str, statement: str, *args, on_update=None, snapshot=None, use_cache: bool = True) -> Any:
+        """
+        Runs a provider call, joining an identical one already in flight.
+        `snapshot` identifies any further inputs (e.g. the bank state), so calls
+        made against different data are never shared.
+        `use_cache=False` skips the provider response cache (used by retries).
+        """
+        key = (method_name, statement.strip().lower(), snapshot, use_cache)
+        entry = self._inflight.get(key)
+        if entry is None:
+            listeners = []
+
+            def broadcast(msg):
+                for listener in listeners:
+                    listener(msg)
+
+            future = asyncio.ensure_future(self.manager.execute_with_fallback(
+                method_name, statement, *args, on_update=broadcast, use_cache=use_cache
+            ))
+            entry = self._inflight[key] = (future, listeners)
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        future, listeners = entry
+        if on_update:
+            listeners.append(on_update)
+        try:
+            # Shielded so one cancelled waiter doesn't cancel the call for the others
+            return await asyncio.shield(future)
+        finally:
+            if on_update:
+                listeners.remove(on_update)
+
     def _update_fuzzy_loading(self, item: VerifierItem, state: VerifierState, msg: str):
         item.fuzzy_status = msg
         state.update_item(item)
@@ -41,11 +101,11 @@ class StatementChecker:
 
         if self.bank:
             # Check bank first
-            for entry in self.bank.statements:
-                if entry.text.strip().lower() == stmt:
-                    item.exact_status = "True" if entry.is_true else "False"
-                    state.update_item(item)
-                    return
+            entry = self.bank.find_exact(stmt)
+            if entry:
+                item.exact_status = "True" if entry.is_true else "False"
+                state.update_item(item)
+                return
 
         # Fallback to files if bank not set or not found (legacy behavior)
         if await self._check_file(self.true_file, stmt):
@@ -57,7 +117,7 @@ class StatementChecker:
 
         state.update_item(item) # Use update_item instead of flag_changed
 
-    async def run_fuzzy_check(self, item: VerifierItem, state: VerifierState):
+    async def run_fuzzy_check(self, item: VerifierItem, state: VerifierState, use_cache: bool = True):
         """Checks for fuzzy match and updates item."""
         item.fuzzy_status = "Checking..."
         state.flag_changed()
@@ -65,24 +125,27 @@ class StatementChecker:
         known_true = []
         known_false = []
         if self.bank:
-            known_true = [s.text for s in self.bank.statements if s.is_true]
-            known_false = [s.text for s in self.bank.statements if not s.is_true]
+            known_true = self.bank.get_known_true_texts()
+            known_false = self.bank.get_known_false_texts()
+            snapshot = self.bank.version
         else:
             try:
-                with open(self.true_file, 'r') as f: known_true = [l.strip() for l in f]
-                with open(self.false_file, 'r') as f: known_false = [l.strip() for l in f]
+                known_true, known_false = await asyncio.gather(
+                    self._read_lines(self.true_file), self._read_lines(self.false_file)
+                )
             except Exception:
                 pass 
+            snapshot = (tuple(known_true), tuple(known_false))
 
         def on_update(msg):
             item.fuzzy_status = msg
             state.flag_changed()
 
         try:
-            res = await self.manager.execute_with_fallback(
+            res = await self._shared_call(
                 'check_similarity', 
                 item.statement, known_true, known_false, 
-                on_update=on_update
+                on_update=on_update, snapshot=snapshot, use_cache=use_cache
             )
             
             if res['status'] == 'found':
@@ -97,7 +160,7 @@ class StatementChecker:
         
         state.flag_changed()
 
-    async def run_llm_check(self, item: VerifierItem, state: VerifierState):
+    async def run_llm_check(self, item: VerifierItem, state: VerifierState, use_cache: bool = True):
         """Checks truthfulness via LLM and updates item."""
         item.llm_status = "Checking..."
         state.flag_changed()
@@ -107,10 +170,10 @@ class StatementChecker:
             state.flag_changed()
 
         try:
-            res = await self.manager.execute_with_fallback(
+            res = await self._shared_call(
                 'verify_truth', 
                 item.statement, 
-                on_update=on_update
+                on_update=on_update, use_cache=use_cache
             )
             
             if res['status'] == 'found':
@@ -123,8 +186,8 @@ class StatementChecker:
         
         state.flag_changed()
 
-    def run_all_checks(self, item: VerifierItem, state: VerifierState):
-        """Spawns all checks for an item."""
+    def run_all_checks(self, item: VerifierItem, state: VerifierState, use_cache: bool = True):
+        """Spawns all checks for an item. Pass use_cache=False to ask the model again."""
         asyncio.create_task(self.run_exact_check(item, state))
-        asyncio.create_task(self.run_fuzzy_check(item, state))
-        asyncio.create_task(self.run_llm_check(item, state))
+        asyncio.create_task(self.run_fuzzy_check(item, state, use_cache=use_cache))
+        asyncio.create_task(self.run_llm_check(item, state, use_cache=use_cache))
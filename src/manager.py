@@ -3,17 +3,36 @@ import os
 import asyncio
 from typing import List, Any
 from src.providers import GeminiProvider, ModelNotFoundError
-from src.ratelimit import RateLimitManager, GlobalRateLimitError
+from src.ratelimit import RATE_LIMITER, GlobalRateLimitError
+
+# Prefer the libyaml-backed C loader, fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
+
+# path -> (mtime_ns, size, parsed config), shared by every ProviderManager
+_CONFIG_CACHE: dict[str, tuple] = {}
 
 class ProviderManager:
     def __init__(self, config_path="config.yaml", api_keys: dict = None):
         self.providers = []
         self.language = "English"
         self.api_keys = api_keys or {}
+        # (provider, method name) -> bound method, reused across fallback retries
+        self._method_cache = {}
         self._load_config(config_path)
+        # First provider of each name, so lookups don't scan the chain
+        self._by_name = {}
+        for p in self.providers:
+            self._by_name.setdefault(p.provider_name, p)
+        # Rate-limit keys parallel to self.providers, checked in one batch per pass
+        self._rl_keys = [p.rate_limit_key for p in self.providers]
     
     def _load_config(self, path):
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             # Fallback default if no config
             print("Config not found, using default Gemini Flash")
             # Default fallback key check?
@@ -21,8 +40,15 @@ class ProviderManager:
             self.providers.append(GeminiProvider(api_key=self.api_keys.get('gemini'), model_name="gemini-2.5-flash", language=self.language))
             return
 
-        with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Reparse only when the file changed since the last manager read it
+        cached = _CONFIG_CACHE.get(path)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            config = cached[2]
+        else:
+            # Raw bytes let libyaml decode the file itself
+            with open(path, 'rb') as f:
+                config = yaml.load(f, Loader=_YLoader)
+            _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, config)
         
         self.language = config.get('language', 'English')
         profiles = config.get('profiles', {})
@@ -60,8 +86,8 @@ class ProviderManager:
         # Add other providers here
 
     def get_provider(self, name: str = "gemini") -> Any:
-        for p in self.providers:
-            if p.provider_name == name: return p
+        p = self._by_name.get(name)
+        if p: return p
         if self.providers: return self.providers[0]
         return None
             
@@ -71,18 +97,18 @@ class ProviderManager:
         If a provider is rate limited, tries the next.
         If all are rate limited, waits for the shortest cooldown and retries.
         """
-        rl_manager = RateLimitManager()
+        rl_manager = RATE_LIMITER
         
         while True:
             # Track if we found any available provider to avoid infinite tight loop if config is empty
             attempted_any = False
             min_wait = float('inf')
             
-            for provider in self.providers:
+            # Pre-check every cooldown at once; providers recheck before their call
+            waits = rl_manager.should_wait_many(self._rl_keys)
+            for provider, wait in zip(self.providers, waits):
                 attempted_any = True
                 
-                # Pre-check cooldown
-                wait = rl_manager.should_wait(provider.provider_name, provider.model_name)
                 if wait > 0:
                     min_wait = min(min_wait, wait)
                     continue
@@ -97,7 +123,10 @@ class ProviderManager:
                         task_func = args[0]
                         return await task_func(provider, on_update=on_update)
                     else:
-                        method = getattr(provider, method_name)
+                        key = (provider, method_name)
+                        method = self._method_cache.get(key)
+                        if method is None:
+                            method = self._method_cache[key] = getattr(provider, method_name)
                         return await method(*args, on_update=on_update, **kwargs)
                 
                 except GlobalRateLimitError as e:
@@ -131,14 +160,13 @@ class ProviderManager:
             else:
                 wait_time = min(min_wait + 0.1, 60) # Add buffer, cap at 60
             
-            # Real-time countdown
+            # Real-time countdown, ticking faster only as the retry gets close
             remaining = wait_time
-            step = 0.2
             while remaining > 0:
-                msg = f"Rate limited. Retrying in {remaining:.1f}s..."
                 if on_update:
-                    on_update(msg)
+                    on_update(f"Rate limited. Retrying in {remaining:.1f}s...")
                 
+                step = 0.1 if remaining < 2 else (0.5 if remaining < 10 else 1.0)
                 to_sleep = min(remaining, step)
                 await asyncio.sleep(to_sleep)
                 remaining -= to_sleep
@@ -1,18 +1,29 @@
 from abc import ABC, abstractmethod
 import asyncio
 import json
+import re
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, List
 from google import genai
-from src.ratelimit import RateLimitManager, GlobalRateLimitError
+from src.ratelimit import RATE_LIMITER, GlobalRateLimitError
+
+# Markdown code fences models wrap JSON answers in, removed in one pass
+_FENCE_RE = re.compile(r"```(?:json)?")
+
+# Parsed answers kept for repeated identical prompts, least recently used dropped first
+RESPONSE_CACHE_SIZE = 256
+# blake2b digest of (model, prompt) -> parsed result, shared by every provider instance
+_response_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
 
 class LLMProvider(ABC):
     @abstractmethod
-    async def check_similarity(self, statement: str, known_true: List[str], known_false: List[str], on_update=None) -> Dict[str, Any]:
+    async def check_similarity(self, statement: str, known_true: List[str], known_false: List[str], on_update=None, use_cache: bool = True) -> Dict[str, Any]:
         """Checks if a statement is similar to known true/false lists."""
         pass
 
     @abstractmethod
-    async def verify_truth(self, statement: str, on_update=None) -> Dict[str, Any]:
+    async def verify_truth(self, statement: str, on_update=None, use_cache: bool = True) -> Dict[str, Any]:
         """Verifies the truth of a statement using general knowledge."""
         pass
 
@@ -24,6 +35,12 @@ class GeminiProvider(LLMProvider):
         self.model_name = model_name
         self.language = language
         self.provider_name = "gemini"
+        # RateLimitManager key, built once instead of per rate-limit check
+        self.rate_limit_key = (self.provider_name, self.model_name)
+        # (known_true, known_false, their JSON) from the last similarity prompt.
+        # The bank hands out the same lists until it changes, so identity is enough;
+        # holding them keeps their ids from being reused.
+        self._known_json = (None, None, "", "")
         
         if api_key:
             self.client = genai.Client(api_key=api_key)
@@ -32,12 +49,30 @@ class GeminiProvider(LLMProvider):
             self.has_api_key = False
     def should_wait(self) -> float:
         """Checks global rate limit state for this provider/model."""
-        return RateLimitManager().should_wait(self.provider_name, self.model_name)
+        return RATE_LIMITER.should_wait_key(self.rate_limit_key)
+
+    def _cache_key(self, prompt: str) -> bytes:
+        return hashlib.blake2b(f"{self.model_name}\0{prompt}".encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _cache_get(key: bytes):
+        result = _response_cache.get(key)
+        if result is not None:
+            _response_cache.move_to_end(key)
+            # Callers may modify the result; the cached one stays intact
+            return dict(result)
+        return None
+
+    @staticmethod
+    def _cache_put(key: bytes, result: Dict[str, Any]):
+        _response_cache[key] = dict(result)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
 
     async def _generate_with_retry(self, prompt: str, files: List[Any] = None, on_update=None) -> Any:
         # Check global limit logic first
-        rl_manager = RateLimitManager()
-        wait_time = rl_manager.should_wait(self.provider_name, self.model_name)
+        rl_manager = RATE_LIMITER
+        wait_time = rl_manager.should_wait_key(self.rate_limit_key)
         if wait_time > 0:
             raise GlobalRateLimitError(self.provider_name, self.model_name, wait_time)
 
@@ -64,16 +99,21 @@ class GeminiProvider(LLMProvider):
             else:
                 raise e
 
-    async def check_similarity(self, statement: str, known_true: List[str], known_false: List[str], on_update=None) -> Dict[str, Any]:
+    async def check_similarity(self, statement: str, known_true: List[str], known_false: List[str], on_update=None, use_cache: bool = True) -> Dict[str, Any]:
         if not self.has_api_key:
              raise Exception("Missing API Key")
 
+        cached_true, cached_false, true_json, false_json = self._known_json
+        if known_true is not cached_true or known_false is not cached_false:
+            true_json, false_json = json.dumps(known_true), json.dumps(known_false)
+            self._known_json = (known_true, known_false, true_json, false_json)
+
         try:
             prompt = f"""
             You are a verification assistant. Verify the 'Input Statement' using ONLY the provided 'Known True' and 'Known False' statements as your knowledge base.
             
-            Known True: {json.dumps(known_true)}
-            Known False: {json.dumps(known_false)}
+            Known True: {true_json}
+            Known False: {false_json}
             
             Input Statement: "{statement}"
             
@@ -98,28 +138,40 @@ class GeminiProvider(LLMProvider):
             }}
             """
             
+            # An identical earlier prompt needs neither the network nor a free rate limit;
+            # use_cache=False asks the model again and refreshes the entry
+            key = self._cache_key(prompt)
+            cached = self._cache_get(key) if use_cache else None
+            if cached is not None:
+                return cached
+
             response = await self._generate_with_retry(prompt, on_update=on_update)
             
             try:
-                text = response.text.replace("```json", "").replace("```", "").strip()
+                text = _FENCE_RE.sub("", response.text or "").strip()
+                # Empty or prose replies can't be JSON; skip the parser
+                if not text or text[0] not in "{[":
+                    raise ValueError("Invalid LLM Response")
                 data = json.loads(text)
                 
                 if data.get("determined"):
-                    return {
+                    result = {
                         "status": "found", 
                         "result": data.get("truth_value"), 
                         "source": "Bank Inference", 
                         "note": data.get("reason")
                     }
                 else:
-                    return {"status": "not_found", "result": None, "source": "Fuzzy Match"}
+                    result = {"status": "not_found", "result": None, "source": "Fuzzy Match"}
+                self._cache_put(key, result)
+                return result
             except json.JSONDecodeError:
                  raise ValueError("Invalid LLM Response")
 
         except GlobalRateLimitError:
             raise
 
-    async def verify_truth(self, statement: str, on_update=None) -> Dict[str, Any]:
+    async def verify_truth(self, statement: str, on_update=None, use_cache: bool = True) -> Dict[str, Any]:
         if not self.has_api_key:
              raise Exception("Missing API Key")
 
@@ -129,18 +181,28 @@ class GeminiProvider(LLMProvider):
             Return JSON only: {{"is_true": bool, "explanation": "short explanation in {self.language}"}}
             """
             
+            key = self._cache_key(prompt)
+            cached = self._cache_get(key) if use_cache else None
+            if cached is not None:
+                return cached
+
             response = await self._generate_with_retry(prompt, on_update=on_update)
             
             try:
-                text = response.text.replace("```json", "").replace("```", "").strip()
+                text = _FENCE_RE.sub("", response.text or "").strip()
+                # Empty or prose replies can't be JSON; skip the parser
+                if not text or text[0] not in "{[":
+                    raise ValueError("Invalid LLM Response")
                 data = json.loads(text)
                 
-                return {
+                result = {
                     "status": "found", 
                     "result": data.get("is_true"), 
                     "source": "AI Knowledge",
                     "note": data.get("explanation")
                 }
+                self._cache_put(key, result)
+                return result
             except json.JSONDecodeError:
                 raise ValueError("Invalid LLM Response")
 
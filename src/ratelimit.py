@@ -1,7 +1,10 @@
 import time
 import json
 import os
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+# should_wait() calls between sweeps of expired cooldowns
+SWEEP_EVERY = 64
 
 class RateLimitManager:
     _instance = None
@@ -11,12 +14,16 @@ class RateLimitManager:
     def set_data_path(cls, data_path: str):
         cls._file_path = os.path.join(data_path, "ratelimits.json")
         if cls._instance:
+            # Replace what was loaded from the previous path
+            cls._instance.cooldowns.clear()
             cls._instance._load()
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(RateLimitManager, cls).__new__(cls)
-            cls._instance.cooldowns = {} # (provider, model) -> timestamp
+            # (provider, model) -> time.monotonic_ns() deadline, immune to clock adjustments
+            cls._instance.cooldowns = {}
+            cls._instance._calls = 0
             cls._instance._load()
         return cls._instance
 
@@ -26,22 +33,27 @@ class RateLimitManager:
         try:
             with open(self._file_path, 'r') as f:
                 data = json.load(f)
+                # The file holds wall-clock seconds; map them onto the monotonic clock
+                now = time.time()
+                mono_ns = time.monotonic_ns()
                 # Convert string keys "provider:model" back to tuple
                 for key_str, ts in data.items():
                     if ":" in key_str:
                         p, m = key_str.split(":", 1)
                         # Only keep if future
-                        if ts > time.time():
-                            self.cooldowns[(p, m)] = ts
+                        if ts > now:
+                            self.cooldowns[(p, m)] = mono_ns + int((ts - now) * 1e9)
         except Exception:
             pass # Ignore corrupt file
 
     def _save(self):
         data = {}
-        now = time.time()
-        for (p, m), ts in self.cooldowns.items():
-            if ts > now:
-                data[f"{p}:{m}"] = ts
+        now = time.monotonic_ns()
+        # Persist wall-clock seconds so they survive a restart
+        wall = time.time()
+        for (p, m), until in self.cooldowns.items():
+            if until > now:
+                data[f"{p}:{m}"] = wall + (until - now) * 1e-9
         
         try:
             with open(self._file_path, 'w') as f:
@@ -52,11 +64,9 @@ class RateLimitManager:
     def report_limit_hit(self, provider: str, model: str, cooldown_seconds: float = 60.0):
         """Mark a provider/model as rate limited for a duration."""
         key = (provider, model)
-        until = time.time() + cooldown_seconds
+        until = time.monotonic_ns() + int(cooldown_seconds * 1e9)
         # If already limited further into future, keep that
-        if key in self.cooldowns:
-            self.cooldowns[key] = max(self.cooldowns[key], until)
-        else:
+        if until > self.cooldowns.get(key, 0):
             self.cooldowns[key] = until
         
         self._save()
@@ -64,17 +74,38 @@ class RateLimitManager:
 
     def should_wait(self, provider: str, model: str) -> float:
         """Returns seconds to wait for this provider/model. 0 if ready."""
-        key = (provider, model)
-        if key not in self.cooldowns:
+        return self.should_wait_key((provider, model))
+
+    def should_wait_key(self, key: Tuple[str, str]) -> float:
+        """should_wait() for a prebuilt (provider, model) key, e.g. a provider's rate_limit_key."""
+        self._calls += 1
+        if self._calls >= SWEEP_EVERY:
+            self._sweep()
+
+        until = self.cooldowns.get(key)
+        if until is None:
             return 0.0
-        
-        remaining = self.cooldowns[key] - time.time()
-        if remaining <= 0:
+        # Integer nanoseconds until the end; converted to seconds only on the way out
+        remaining = until - time.monotonic_ns()
+        return remaining * 1e-9 if remaining > 0 else 0.0
+
+    def should_wait_many(self, keys: List[Tuple[str, str]]) -> List[float]:
+        """should_wait_key() for every key in order, against one clock reading."""
+        cooldowns = self.cooldowns
+        now = time.monotonic_ns()
+        return [((until - now) * 1e-9 if until > now else 0.0)
+                for until in [cooldowns.get(key, now) for key in keys]]
+
+    def _sweep(self):
+        """Drops expired cooldowns in one pass; _save() already skips them on disk."""
+        self._calls = 0
+        now = time.monotonic_ns()
+        expired = [key for key, until in self.cooldowns.items() if until <= now]
+        for key in expired:
             del self.cooldowns[key]
-            self._save() # Clean up expired
-            return 0.0
-        
-        return remaining
+
+# Shared instance, so hot paths skip the singleton check in __new__
+RATE_LIMITER = RateLimitManager()
 
 class GlobalRateLimitError(Exception):
     def __init__(self, provider, model, wait_time):
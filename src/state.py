@@ -3,6 +3,7 @@ import os
 from dataclasses import dataclass, field
 from typing import List, Optional
 import asyncio
+from src.debounce import DebouncedSave
 
 @dataclass
 class VerifierItem:
@@ -23,6 +24,8 @@ class VerifierState:
         self._lock = asyncio.Lock()
         self.changed = True # Dirty flag for UI redraw
         self.persistence_file = persistence_file
+        # Coalesces progress-tick saves, see flag_changed()
+        self._saver = DebouncedSave(self._write)
         self._load()
 
     def _load(self):
@@ -44,6 +47,9 @@ class VerifierState:
             print(f"Error loading VS history: {e}")
 
     def _save(self):
+        self._saver.now()
+
+    def _write(self):
          try:
              # Convert to dicts
              data = [vars(i) for i in self.items]
@@ -91,9 +97,12 @@ class VerifierState:
     # but having a method triggers the dirty flag.
     def flag_changed(self):
         self.changed = True
-        self._save()
+        self._saver.schedule()
 
     def update_item(self, item: VerifierItem):
         """Signal that an item has been updated."""
         self.changed = True
-        self._save()
+
+    def flush(self):
+        """Writes a pending debounced save now."""
+        self._saver.flush()
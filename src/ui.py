@@ -1,6 +1,6 @@
 import asyncio
-import shlex
 import os
+import re
 from abc import ABC, abstractmethod
 from prompt_toolkit import Application
 from prompt_toolkit.layout.containers import HSplit, Window, FloatContainer, Float
@@ -196,19 +196,16 @@ class StatementBankView(ScrollableListView):
         page_size = self._get_page_size()
         visible_items = all_items[self.scroll_offset : self.scroll_offset + page_size]
         
-        import re
+        # Case-insensitive via (?i), as Rich's API varies on the flags arg
+        highlight = "(?i)" + re.escape(self.search_query) if self.search_query else None
         for i, item in enumerate(visible_items):
             truth_str = "True" if item.is_true else "False"
             style = "green" if item.is_true else "red"
             
             stmt_text = Text(item.text, style="white")
-            if self.search_query:
+            if highlight:
                 # Highlight the search query in the text
-                # We use (?i) for case-insensitivity as Rich's API varies on flags arg
-                stmt_text.highlight_regex(
-                    "(?i)" + re.escape(self.search_query), 
-                    style="bold black on yellow"
-                )
+                stmt_text.highlight_regex(highlight, style="bold black on yellow")
 
             table.add_row(str(item.id), stmt_text, Text(truth_str, style=style))
 
@@ -517,11 +514,13 @@ class ViewManager:
             "Help": []
         }
         self.views = []
+        self.views_by_name = {}
         self.active_index = 0
         self.on_change = on_change
     
     def add_view(self, view: View, group: str = "Statements"):
         self.views.append(view)
+        self.views_by_name[view.name] = view
         if group not in self.groups:
             self.groups[group] = []
         self.groups[group].append(view)
@@ -1235,7 +1234,8 @@ class App:
         item.llm_detail = None
         
         self.state.update_item(item)
-        self.checker.run_all_checks(item, self.state)
+        # A retry must reach the model, not the cached earlier answer
+        self.checker.run_all_checks(item, self.state, use_cache=False)
         self.show_message("Success", f"Retrying verification for {item_id}.")
 
     async def _refresh_loop(self):
@@ -1298,3 +1298,5 @@ class App:
         finally:
             self.running = False
             refresh_task.cancel()
+            self.state.flush()
+            self.e_session.flush()
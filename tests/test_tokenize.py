@@ -0,0 +1,46 @@
+import random
+import shlex
+import unittest
+
+from src.commands import _tokenize
+
+
+def _reference(text: str, posix: bool):
+    """The shlex-based parsing CommandRegistry used before _tokenize."""
+    parts = shlex.split(text, posix=posix)
+    if not posix:
+        # Non-POSIX mode keeps quotes; strip matching outer ones
+        parts = [p[1:-1] if len(p) >= 2 and p[0] == p[-1] and p[0] in '"\'' else p
+                 for p in parts]
+    return parts
+
+
+class TokenizeTest(unittest.TestCase):
+    ALPHABET = ['a', 'b', ' ', '  ', '\t', '"', "'", '\\', ':', 'x', 'C:\\x', 'é', '\xa0', '\x0b', '\u2003']
+
+    def assert_same(self, text: str, posix: bool):
+        try:
+            expected = _reference(text, posix)
+        except ValueError:
+            with self.assertRaises(ValueError, msg=repr(text)):
+                _tokenize(text, posix=posix)
+            return
+        self.assertEqual(_tokenize(text, posix=posix), expected, repr(text))
+
+    def test_examples(self):
+        for posix in (True, False):
+            for text in (":sb add don't true", ':sb add "a b" true', 'C:\\x"  ',
+                         'b\\"', ":sb import 'C:\\data\\x.csv'", ':b sb', ''):
+                with self.subTest(text=text, posix=posix):
+                    self.assert_same(text, posix)
+
+    def test_matches_shlex_on_random_input(self):
+        rng = random.Random(1234)
+        for _ in range(5000):
+            text = "".join(rng.choice(self.ALPHABET) for _ in range(rng.randint(0, 10)))
+            for posix in (True, False):
+                self.assert_same(text, posix)
+
+
+if __name__ == "__main__":
+    unittest.main()